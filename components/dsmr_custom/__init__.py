@@ -21,6 +21,8 @@
 
 """dsmr_custom component for ESPHome."""
 
+import re
+import string
 from pathlib import Path
 from esphome import pins
 import esphome.codegen as cg
@@ -55,6 +57,7 @@ dsmr_custom_ns = cg.esphome_ns.namespace(DOMAIN)
 Dsmr = dsmr_custom_ns.class_("Dsmr", cg.Component, uart.UARTDevice)
 
 COMPONENT_DIRECTORY = Path(__file__).parent.resolve()
+_INCLUDE_FLAG = f"-I{COMPONENT_DIRECTORY.as_posix()}"
 
 CONF_DECRYPTION_KEY = "decryption_key"
 CONF_REQUEST_PIN = "request_pin"
@@ -68,32 +71,41 @@ CONF_CUSTOM_OBIS_SENSORS = "custom_obis_sensors"
 CONF_OBIS_CODE = "code"
 CONF_SENSOR_TYPE = "type"
 
+# Characters in an OBIS code that are not valid in a C++ identifier.
+_OBIS_SANITIZE = str.maketrans({':': '_', '.': '_', '-': '_'})
+
+# A decryption key already in the normalized form returned by _validate_key.
+_CANONICAL_KEY = re.compile(r"[0-9A-F]{32}").fullmatch
+
 def _validate_key(value):
     value = cv.string_strict(value)
     if not value:
         return ""
-    parts = [value[i : i + 2] for i in range(0, len(value), 2)]
-    if len(parts) != 16:
+    if _CANONICAL_KEY(value):
+        return value
+    if len(value) != 32:
         raise cv.Invalid(
             f"Decryption key must consist of 16 hexadecimal numbers (32 characters), got {len(value)} characters."
         )
-    parts_int = []
-    if any(len(part) != 2 for part in parts):
+    try:
+        raw = bytes.fromhex(value)
+    except ValueError:
+        # Only reached on bad input: point at the offending byte pair once.
+        pos = next(i for i, c in enumerate(value) if c not in string.hexdigits)
+        pos -= pos % 2
+        raise cv.Invalid(
+            f"Decryption key part '{value[pos : pos + 2]}' is not a valid hexadecimal number."
+        )
+    # bytes.fromhex() skips whitespace between pairs, so "00 11 ..." would pass the length check above.
+    if len(raw) != 16:
         raise cv.Invalid("Decryption key must be in format XXXXXX... (32 hex chars).")
-    for part in parts:
-        try:
-            parts_int.append(int(part, 16))
-        except ValueError:
-            raise cv.Invalid(
-                f"Decryption key part '{part}' is not a valid hexadecimal number."
-            )
-    return "".join(f"{part:02X}" for part in parts_int)
+    return raw.hex().upper()
 
 
 CUSTOM_OBIS_SENSOR_SCHEMA = cv.Schema({
     cv.Required(CONF_OBIS_CODE): cv.string_strict,
     cv.Required(CONF_NAME): cv.string_strict,
-    cv.Required(CONF_SENSOR_TYPE): cv.enum({"sensor": "sensor", "text_sensor": "text_sensor"}, lower=True),
+    cv.Required(CONF_SENSOR_TYPE): cv.one_of("sensor", "text_sensor", lower=True),
     cv.Optional(CONF_UNIT_OF_MEASUREMENT): cv.string_strict,
     cv.Optional(CONF_ACCURACY_DECIMALS): cv.positive_int,
     cv.Optional(CONF_DEVICE_CLASS): cv.string_strict,
@@ -105,6 +117,29 @@ CUSTOM_OBIS_SENSOR_SCHEMA = cv.Schema({
     cv.Optional(CONF_INTERNAL, default=False): cv.boolean,
 })
 
+_CUSTOM_OBIS_LIST = cv.ensure_list(CUSTOM_OBIS_SENSOR_SCHEMA)
+
+# Optional entity fields copied from a custom OBIS entry only when the user set them.
+_OPTIONAL_SENSOR_KEYS = frozenset((
+    CONF_UNIT_OF_MEASUREMENT,
+    CONF_ACCURACY_DECIMALS,
+    CONF_DEVICE_CLASS,
+    CONF_STATE_CLASS,
+    CONF_ICON,
+))
+_OPTIONAL_TEXT_SENSOR_KEYS = frozenset((CONF_ICON,))
+
+
+def _build_sensor_payload(conf_item, sensor_id_obj):
+    """Return the entity fields shared by custom numeric and text sensors."""
+    return {
+        CONF_ID: sensor_id_obj,
+        CONF_NAME: conf_item[CONF_NAME],
+        CONF_DISABLED_BY_DEFAULT: conf_item[CONF_DISABLED_BY_DEFAULT],
+        CONF_ENTITY_CATEGORY: conf_item[CONF_ENTITY_CATEGORY],
+        CONF_INTERNAL: conf_item[CONF_INTERNAL],
+    }
+
 CONFIG_SCHEMA = cv.Schema(
     {
         cv.GenerateID(): cv.declare_id(Dsmr),
@@ -116,7 +151,7 @@ CONFIG_SCHEMA = cv.Schema(
         cv.Optional(CONF_CRC_CHECK, default=True): cv.boolean,
         cv.Optional(CONF_GAS_MBUS_ID, default=1): cv.int_range(min=0, max=255),
         cv.Optional(CONF_WATER_MBUS_ID, default=2): cv.int_range(min=0, max=255),
-        cv.Optional(CONF_CUSTOM_OBIS_SENSORS): cv.ensure_list(CUSTOM_OBIS_SENSOR_SCHEMA),
+        cv.Optional(CONF_CUSTOM_OBIS_SENSORS): _CUSTOM_OBIS_LIST,
         cv.Optional(CONF_PLATFORMIO_OPTIONS, default={}): cv.Schema(
             {
                 cv.Optional("lib_deps"): cv.ensure_list(cv.string_strict),
@@ -144,12 +179,13 @@ async def to_code(config):
 
     pio_options = config.get(CONF_PLATFORMIO_OPTIONS, {})
     lib_deps_yaml = pio_options.get("lib_deps", [])
+    add_library = cg.add_library
     for dep in lib_deps_yaml:
-        cg.add_library(dep, None)
+        add_library(dep, None)
 
     # Ensure the component's root directory itself is in includes
     # This helps resolve includes like #include "parser.h" if parser.h is in the same directory as dsmr.h
-    cg.add_build_flag(f"-I{COMPONENT_DIRECTORY.resolve().as_posix()}")
+    cg.add_build_flag(_INCLUDE_FLAG)
 
     cg.add(var.set_max_telegram_length(config[CONF_MAX_TELEGRAM_LENGTH]))
     cg.add(var.set_receive_timeout(config[CONF_RECEIVE_TIMEOUT].total_milliseconds))
@@ -163,57 +199,41 @@ async def to_code(config):
 
     cg.add(var.set_request_interval(config[CONF_REQUEST_INTERVAL].total_milliseconds))
 
-    cg.add_build_flag(f"-DDSMR_CUSTOM_GAS_MBUS_ID={config[CONF_GAS_MBUS_ID]}")
-    cg.add_build_flag(f"-DDSMR_CUSTOM_WATER_MBUS_ID={config[CONF_WATER_MBUS_ID]}")
+    add_build_flag = cg.add_build_flag
+    for flag in (
+        f"-DDSMR_CUSTOM_GAS_MBUS_ID={config[CONF_GAS_MBUS_ID]}",
+        f"-DDSMR_CUSTOM_WATER_MBUS_ID={config[CONF_WATER_MBUS_ID]}",
+    ):
+        add_build_flag(flag)
 
     if CONF_CUSTOM_OBIS_SENSORS in config:
+        base_id = config[CONF_ID].id
+        declare_sensor_id = cv.declare_id(esphome_global_sensor.Sensor)
+        declare_text_sensor_id = cv.declare_id(esphome_global_text_sensor.TextSensor)
+        new_sensor = esphome_global_sensor.new_sensor
+        new_text_sensor = esphome_global_text_sensor.new_text_sensor
         for i, conf_item in enumerate(config[CONF_CUSTOM_OBIS_SENSORS]):
             obis_code = conf_item[CONF_OBIS_CODE]
-            sensor_name = conf_item[CONF_NAME]
             sensor_type_str = conf_item[CONF_SENSOR_TYPE]
-            disabled_by_default = conf_item[CONF_DISABLED_BY_DEFAULT]
-            entity_category = conf_item[CONF_ENTITY_CATEGORY]
-            internal = conf_item[CONF_INTERNAL]
 
-            sanitized_obis = obis_code.replace(':', '_').replace('.', '_').replace('-', '_')
-            sensor_id_str = f"{config[CONF_ID].id}_custom_{sanitized_obis}_{i}"
+            sanitized_obis = obis_code.translate(_OBIS_SANITIZE)
+            sensor_id_str = f"{base_id}_custom_{sanitized_obis}_{i}"
 
             if sensor_type_str == "sensor":
-                force_update = conf_item[CONF_FORCE_UPDATE]
-                sensor_id_obj = cv.declare_id(esphome_global_sensor.Sensor)(sensor_id_str)
-                sensor_config_payload = {
-                    CONF_ID: sensor_id_obj,
-                    CONF_NAME: sensor_name,
-                    CONF_DISABLED_BY_DEFAULT: disabled_by_default,
-                    CONF_ENTITY_CATEGORY: entity_category,
-                    CONF_INTERNAL: internal,
-                    CONF_FORCE_UPDATE: force_update,
-                }
-                if CONF_UNIT_OF_MEASUREMENT in conf_item:
-                    sensor_config_payload[CONF_UNIT_OF_MEASUREMENT] = conf_item[CONF_UNIT_OF_MEASUREMENT]
-                if CONF_ACCURACY_DECIMALS in conf_item:
-                    sensor_config_payload[CONF_ACCURACY_DECIMALS] = conf_item[CONF_ACCURACY_DECIMALS]
-                if CONF_DEVICE_CLASS in conf_item:
-                    sensor_config_payload[CONF_DEVICE_CLASS] = conf_item[CONF_DEVICE_CLASS]
-                if CONF_STATE_CLASS in conf_item:
-                    sensor_config_payload[CONF_STATE_CLASS] = conf_item[CONF_STATE_CLASS]
-                if CONF_ICON in conf_item:
-                    sensor_config_payload[CONF_ICON] = conf_item[CONF_ICON]
-
-                sens = await esphome_global_sensor.new_sensor(sensor_config_payload)
+                sensor_id_obj = declare_sensor_id(sensor_id_str)
+                sensor_config_payload = _build_sensor_payload(conf_item, sensor_id_obj)
+                sensor_config_payload[CONF_FORCE_UPDATE] = conf_item[CONF_FORCE_UPDATE]
+                for k in conf_item.keys() & _OPTIONAL_SENSOR_KEYS:
+                    sensor_config_payload[k] = conf_item[k]
+
+                sens = await new_sensor(sensor_config_payload)
                 cg.add(var.add_custom_numeric_sensor(obis_code, sens))
 
             elif sensor_type_str == "text_sensor":
-                sensor_id_obj = cv.declare_id(esphome_global_text_sensor.TextSensor)(sensor_id_str)
-                text_sensor_config_payload = {
-                    CONF_ID: sensor_id_obj,
-                    CONF_NAME: sensor_name,
-                    CONF_DISABLED_BY_DEFAULT: disabled_by_default,
-                    CONF_ENTITY_CATEGORY: entity_category,
-                    CONF_INTERNAL: internal,
-                }
-                if CONF_ICON in conf_item:
-                    text_sensor_config_payload[CONF_ICON] = conf_item[CONF_ICON]
-
-                text_sens = await esphome_global_text_sensor.new_text_sensor(text_sensor_config_payload)
+                sensor_id_obj = declare_text_sensor_id(sensor_id_str)
+                text_sensor_config_payload = _build_sensor_payload(conf_item, sensor_id_obj)
+                for k in conf_item.keys() & _OPTIONAL_TEXT_SENSOR_KEYS:
+                    text_sensor_config_payload[k] = conf_item[k]
+
+                text_sens = await new_text_sensor(text_sensor_config_payload)
                 cg.add(var.add_custom_text_sensor(obis_code, text_sens))
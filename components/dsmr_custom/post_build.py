@@ -1,37 +1,48 @@
 import os
-from SCons.Script import Import
+import sys
+from SCons.Script import ARGUMENTS, Import
 
 Import("env")
 
+# The build directory where ESP-IDF components are compiled
+# Use BUILD_DIR which points to .pioenvs/<env_name>/
+# It is fixed for the environment, so resolve it once when the script is loaded
+# rather than on every invocation of the pre-action.
+_BUILD_DIR = env.subst("$BUILD_DIR")
+
+# MbedTLS libraries are in multiple directories:
+# - libmbedtls.a: esp-idf/mbedtls/
+# - libmbedcrypto.a, libmbedx509.a: esp-idf/mbedtls/mbedtls/library/
+_MBEDTLS_MAIN_DIR = os.path.join(_BUILD_DIR, "esp-idf", "mbedtls")
+_MBEDTLS_LIB_DIR = os.path.join(_MBEDTLS_MAIN_DIR, "mbedtls", "library")
+_DEBUG_FILE = os.path.join(_BUILD_DIR, "debug_post_build.txt")
+
+# Only log (and write the debug file) for verbose PlatformIO builds (`pio run -v`).
+# Normal builds do no extra I/O here.
+_VERBOSE = bool(int(ARGUMENTS.get("PIOVERBOSE", 0)))
+_VERBOSE_MSG = (
+    "DSMR Custom: Injecting mbedtls libraries into firmware linker...\n"
+    f"DSMR Custom: Added LIBPATH: {_MBEDTLS_MAIN_DIR}\n"
+    f"DSMR Custom: Added LIBPATH: {_MBEDTLS_LIB_DIR}\n"
+    "DSMR Custom: Added LIBS: mbedtls, mbedx509, mbedcrypto\n"
+)
+
 def add_mbedtls_linker_flags(target, source, env):
     """
     Add mbedtls libraries to the linker for the main firmware only.
     This function is called via AddPreAction hook, which ensures it only runs
     when linking firmware.elf, not bootloader.elf.
     """
-    print("DSMR Custom: Injecting mbedtls libraries into firmware linker...")
-    
-    # The build directory where ESP-IDF components are compiled
-    # Use BUILD_DIR which points to .pioenvs/<env_name>/
-    build_dir = env.subst("$BUILD_DIR")
-    
-    # MbedTLS libraries are in multiple directories:
-    # - libmbedtls.a: esp-idf/mbedtls/
-    # - libmbedcrypto.a, libmbedx509.a: esp-idf/mbedtls/mbedtls/library/
-    mbedtls_main_dir = os.path.join(build_dir, "esp-idf", "mbedtls")
-    mbedtls_lib_dir = os.path.join(build_dir, "esp-idf", "mbedtls", "mbedtls", "library")
-    
-    # Debug logging
-    debug_file = os.path.join(build_dir, "debug_post_build.txt")
-    with open(debug_file, "w") as f:
-        f.write("Running post_build.py via AddPreAction\n")
-        f.write(f"Target: {target}\n")
-        f.write(f"BUILD_DIR: {build_dir}\n")
-        f.write(f"mbedtls_main_dir: {mbedtls_main_dir}\n")
-        f.write(f"mbedtls_lib_dir: {mbedtls_lib_dir}\n")
+    # SCons may run the pre-action more than once for the same environment.
+    # Our library directories are only ever added here, so finding them on
+    # LIBPATH means LIBS was already extended too. Appending again would only
+    # duplicate entries on the linker command line.
+    current_libpath = {str(p) for p in env.get("LIBPATH", [])}
+    if _MBEDTLS_MAIN_DIR in current_libpath and _MBEDTLS_LIB_DIR in current_libpath:
+        return
     
     # Add both directories to the linker search path
-    env.Append(LIBPATH=[mbedtls_main_dir, mbedtls_lib_dir])
+    env.Append(LIBPATH=[_MBEDTLS_MAIN_DIR, _MBEDTLS_LIB_DIR])
     
     # CRITICAL: Library order matters for GNU linker!
     # mbedtls depends on mbedx509 and mbedcrypto
@@ -39,13 +50,22 @@ def add_mbedtls_linker_flags(target, source, env):
     # Therefore: mbedtls -> mbedx509 -> mbedcrypto (dependency last)
     env.Append(LIBS=["mbedtls", "mbedx509", "mbedcrypto"])
     
-    with open(debug_file, "a") as f:
-        f.write(f"Added LIBPATH: {mbedtls_main_dir}, {mbedtls_lib_dir}\n")
-        f.write("Added LIBS: mbedtls, mbedx509, mbedcrypto (correct order)\n")
+    if not _VERBOSE:
+        return
+    
+    sys.stdout.write(_VERBOSE_MSG)
     
-    print(f"DSMR Custom: Added LIBPATH: {mbedtls_main_dir}")
-    print(f"DSMR Custom: Added LIBPATH: {mbedtls_lib_dir}")
-    print(f"DSMR Custom: Added LIBS: mbedtls, mbedx509, mbedcrypto")
+    # Debug logging, written in one go once the linker settings are applied
+    with open(_DEBUG_FILE, "w") as f:
+        f.writelines([
+            "Running post_build.py via AddPreAction\n",
+            f"Target: {target}\n",
+            f"BUILD_DIR: {_BUILD_DIR}\n",
+            f"mbedtls_main_dir: {_MBEDTLS_MAIN_DIR}\n",
+            f"mbedtls_lib_dir: {_MBEDTLS_LIB_DIR}\n",
+            f"Added LIBPATH: {_MBEDTLS_MAIN_DIR}, {_MBEDTLS_LIB_DIR}\n",
+            "Added LIBS: mbedtls, mbedx509, mbedcrypto (correct order)\n",
+        ])
 
 # Use AddPreAction to hook into the firmware linking stage only
 # This ensures the libraries are only added when linking firmware.elf, not bootloader.elf
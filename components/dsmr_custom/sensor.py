@@ -37,12 +37,13 @@ in `custom_obis_sensors` (in the main `dsmr_custom:` hub config), the custom
 definition will take precedence due to the C++ override mechanism in the hub.
 """
 
+import functools
+
 import esphome.codegen as cg
 import esphome.config_validation as cv
 # Import the global sensor component module for sensor.sensor_schema.
 from esphome.components import sensor
 from esphome.const import (
-    CONF_ID, # Used internally by sensor.new_sensor
     # Device Classes for sensors
     DEVICE_CLASS_CURRENT,
     DEVICE_CLASS_ENERGY,
@@ -71,6 +72,9 @@ from esphome.const import (
 from . import Dsmr as DsmrCustomHubClass # Alias for clarity
 # Configuration key to link platform sensors to a specific dsmr_custom hub instance.
 CONF_DSMR_CUSTOM_HUB_ID = "dsmr_custom_hub_id"
+# Schema key and validator for CONF_DSMR_CUSTOM_HUB_ID, created once and shared by the schema.
+_GENERATE_HUB_ID = cv.GenerateID(CONF_DSMR_CUSTOM_HUB_ID)
+_HUB_VALIDATOR = cv.use_id(DsmrCustomHubClass)
 
 # Ensures the main 'dsmr_custom' hub component (defined in __init__.py)
 # is loaded automatically when this sensor platform is used. This makes the
@@ -78,293 +82,173 @@ CONF_DSMR_CUSTOM_HUB_ID = "dsmr_custom_hub_id"
 # This is a standard pattern for custom components that provide a hub and platforms.
 AUTO_LOAD = ["dsmr_custom"]
 
-# Defines the YAML configuration schema for the dsmr_custom sensor platform.
-# Users can enable and configure individual standard numeric DSMR sensors here.
-CONFIG_SCHEMA = cv.Schema(
-    {
-        # Required: Link to an existing dsmr_custom hub component ID.
-        # All sensors defined here will be associated with this hub.
-        cv.GenerateID(CONF_DSMR_CUSTOM_HUB_ID): cv.use_id(DsmrCustomHubClass),
 
-        # Optional configuration for each standard numeric sensor.
-        # These follow the naming convention from the matthijskooijman/arduino-dsmr library
-        # or common DSMR standards. The keys here (e.g., "energy_delivered_lux")
-        # become part of the C++ preprocessor macro DSMR_CUSTOM_SENSOR_LIST.
+@functools.lru_cache(maxsize=None)
+def _num_schema(unit=None, decimals=0, device_class=None, state_class=None):
+    """Return the sensor_schema() for one unit/decimals/class combination.
+
+    Cached, so every standard sensor with the same combination shares a single
+    schema object (sensor_schema() generates a fresh ID per configured sensor,
+    so sharing is safe). Only arguments that are set are forwarded, leaving
+    sensor_schema()'s own defaults in place for the rest.
+    """
+    kwargs = {"accuracy_decimals": decimals}
+    if unit is not None:
+        kwargs["unit_of_measurement"] = unit
+    if device_class is not None:
+        kwargs["device_class"] = device_class
+    if state_class is not None:
+        kwargs["state_class"] = state_class
+    return sensor.sensor_schema(**kwargs)
+
+
+# Shared schemas for the standard sensors below. Most DSMR readings fall into a
+# handful of unit/device_class/state_class combinations.
+_ENERGY_TOTAL_SCHEMA = _num_schema(
+    unit=UNIT_KILOWATT_HOURS,
+    decimals=3,
+    device_class=DEVICE_CLASS_ENERGY,
+    state_class=STATE_CLASS_TOTAL_INCREASING,
+)
+_REACTIVE_ENERGY_TOTAL_SCHEMA = _num_schema(
+    unit=UNIT_KILOVOLT_AMPS_REACTIVE_HOURS, # kvarh
+    decimals=3,
+    device_class=DEVICE_CLASS_ENERGY, # Or a more specific reactive energy class if available
+    state_class=STATE_CLASS_TOTAL_INCREASING,
+)
+_POWER_MEAS_SCHEMA = _num_schema(
+    unit=UNIT_KILOWATT, # Or UNIT_WATT if parser provides W
+    decimals=3,
+    device_class=DEVICE_CLASS_POWER,
+    state_class=STATE_CLASS_MEASUREMENT,
+)
+_KVAR_SCHEMA = _num_schema(
+    unit=UNIT_KILOVOLT_AMPS_REACTIVE, # kvar
+    decimals=3,
+    state_class=STATE_CLASS_MEASUREMENT,
+)
+_CURRENT_SCHEMA = _num_schema(
+    unit=UNIT_AMPERE,
+    decimals=1, # Or 2, or 3 depending on meter/parser
+    device_class=DEVICE_CLASS_CURRENT,
+    state_class=STATE_CLASS_MEASUREMENT,
+)
+_VOLTAGE_SCHEMA = _num_schema(
+    unit=UNIT_VOLT,
+    decimals=1,
+    device_class=DEVICE_CLASS_VOLTAGE,
+    state_class=STATE_CLASS_MEASUREMENT,
+)
+_GAS_SCHEMA = _num_schema(
+    unit=UNIT_CUBIC_METER,
+    decimals=3,
+    device_class=DEVICE_CLASS_GAS,
+    state_class=STATE_CLASS_TOTAL_INCREASING,
+)
+_COUNT_SCHEMA = _num_schema(decimals=0) # Counters and integer/enum values
 
-        # --- Energy Delivered/Returned ---
-        cv.Optional("energy_delivered_lux"): sensor.sensor_schema(
-            unit_of_measurement=UNIT_KILOWATT_HOURS,
-            accuracy_decimals=3,
-            device_class=DEVICE_CLASS_ENERGY,
-            state_class=STATE_CLASS_TOTAL_INCREASING,
-            # icon="mdi:home-import-outline", # Example icon
-        ),
-        cv.Optional("energy_delivered_tariff1"): sensor.sensor_schema(
-            unit_of_measurement=UNIT_KILOWATT_HOURS,
-            accuracy_decimals=3,
-            device_class=DEVICE_CLASS_ENERGY,
-            state_class=STATE_CLASS_TOTAL_INCREASING,
-            # icon="mdi:counter",
-        ),
-        cv.Optional("energy_delivered_tariff2"): sensor.sensor_schema(
-            unit_of_measurement=UNIT_KILOWATT_HOURS,
-            accuracy_decimals=3,
-            device_class=DEVICE_CLASS_ENERGY,
-            state_class=STATE_CLASS_TOTAL_INCREASING,
-            # icon="mdi:counter",
-        ),
-        cv.Optional("energy_returned_lux"): sensor.sensor_schema( # Corresponds to OBIS 1-0:2.8.0
-            unit_of_measurement=UNIT_KILOWATT_HOURS,
-            accuracy_decimals=3,
-            device_class=DEVICE_CLASS_ENERGY,
-            state_class=STATE_CLASS_TOTAL_INCREASING,
-            # icon="mdi:home-export-outline",
-        ),
-        cv.Optional("energy_returned_tariff1"): sensor.sensor_schema(
-            unit_of_measurement=UNIT_KILOWATT_HOURS,
-            accuracy_decimals=3,
-            device_class=DEVICE_CLASS_ENERGY,
-            state_class=STATE_CLASS_TOTAL_INCREASING,
-            # icon="mdi:counter",
-        ),
-        cv.Optional("energy_returned_tariff2"): sensor.sensor_schema(
-            unit_of_measurement=UNIT_KILOWATT_HOURS,
-            accuracy_decimals=3,
-            device_class=DEVICE_CLASS_ENERGY,
-            state_class=STATE_CLASS_TOTAL_INCREASING,
-            # icon="mdi:counter",
-        ),
-        # Reactive Energy (example, if supported by standard parser fields)
-        cv.Optional("total_imported_energy"): sensor.sensor_schema( # Typically reactive import, e.g., 1-0:3.8.0
-            unit_of_measurement=UNIT_KILOVOLT_AMPS_REACTIVE_HOURS, # kvarh
-            accuracy_decimals=3,
-            device_class=DEVICE_CLASS_ENERGY, # Or a more specific reactive energy class if available
-            state_class=STATE_CLASS_TOTAL_INCREASING,
-            # icon="mdi:sine-wave",
-        ),
-        cv.Optional("total_exported_energy"): sensor.sensor_schema( # Typically reactive export, e.g., 1-0:4.8.0
-            unit_of_measurement=UNIT_KILOVOLT_AMPS_REACTIVE_HOURS, # kvarh
-            accuracy_decimals=3,
-            device_class=DEVICE_CLASS_ENERGY,
-            state_class=STATE_CLASS_TOTAL_INCREASING,
-            # icon="mdi:sine-wave",
-        ),
+# Standard numeric sensors as (key, schema) rows. The keys follow the naming
+# convention from the matthijskooijman/arduino-dsmr library or common DSMR
+# standards. Each key (e.g., "energy_delivered_lux") becomes part of the C++
+# preprocessor macro DSMR_CUSTOM_SENSOR_LIST and names the hub setter
+# (set_<key>) used in to_code().
+_NUMERIC_SENSOR_DEFS = (
+    # --- Energy Delivered/Returned ---
+    ("energy_delivered_lux", _ENERGY_TOTAL_SCHEMA),
+    ("energy_delivered_tariff1", _ENERGY_TOTAL_SCHEMA),
+    ("energy_delivered_tariff2", _ENERGY_TOTAL_SCHEMA),
+    ("energy_returned_lux", _ENERGY_TOTAL_SCHEMA), # Corresponds to OBIS 1-0:2.8.0
+    ("energy_returned_tariff1", _ENERGY_TOTAL_SCHEMA),
+    ("energy_returned_tariff2", _ENERGY_TOTAL_SCHEMA),
+    # Reactive Energy (example, if supported by standard parser fields)
+    ("total_imported_energy", _REACTIVE_ENERGY_TOTAL_SCHEMA), # Typically reactive import, e.g., 1-0:3.8.0
+    ("total_exported_energy", _REACTIVE_ENERGY_TOTAL_SCHEMA), # Typically reactive export, e.g., 1-0:4.8.0
 
-        # --- Power ---
-        cv.Optional("power_delivered"): sensor.sensor_schema( # Total active power import (+P)
-            unit_of_measurement=UNIT_KILOWATT, # Or UNIT_WATT if parser provides W
-            accuracy_decimals=3,
-            device_class=DEVICE_CLASS_POWER,
-            state_class=STATE_CLASS_MEASUREMENT,
-            # icon="mdi:flash",
-        ),
-        cv.Optional("power_returned"): sensor.sensor_schema( # Total active power export (-P)
-            unit_of_measurement=UNIT_KILOWATT,
-            accuracy_decimals=3,
-            device_class=DEVICE_CLASS_POWER,
-            state_class=STATE_CLASS_MEASUREMENT,
-            # icon="mdi:flash-outline",
-        ),
-        # Reactive Power
-        cv.Optional("reactive_power_delivered"): sensor.sensor_schema( # Total reactive power import (+Q)
-            unit_of_measurement=UNIT_KILOVOLT_AMPS_REACTIVE, # kvar
-            accuracy_decimals=3,
-            state_class=STATE_CLASS_MEASUREMENT,
-            # icon="mdi:sine-wave", # Consider specific icon for reactive power
-        ),
-        cv.Optional("reactive_power_returned"): sensor.sensor_schema( # Total reactive power export (-Q)
-            unit_of_measurement=UNIT_KILOVOLT_AMPS_REACTIVE, # kvar
-            accuracy_decimals=3,
-            state_class=STATE_CLASS_MEASUREMENT,
-            # icon="mdi:sine-wave",
-        ),
+    # --- Power ---
+    ("power_delivered", _POWER_MEAS_SCHEMA), # Total active power import (+P)
+    ("power_returned", _POWER_MEAS_SCHEMA), # Total active power export (-P)
+    # Reactive Power
+    ("reactive_power_delivered", _KVAR_SCHEMA), # Total reactive power import (+Q)
+    ("reactive_power_returned", _KVAR_SCHEMA), # Total reactive power export (-Q)
 
-        # --- Electricity Status & Failures ---
-        cv.Optional("electricity_threshold"): sensor.sensor_schema( # Not common in modern DSMR
-            accuracy_decimals=3, # Unit depends on specific OBIS code definition
-        ),
-        cv.Optional("electricity_switch_position"): sensor.sensor_schema( # Not common
-            accuracy_decimals=0, # Typically an integer/enum
-        ),
-        cv.Optional("electricity_failures"): sensor.sensor_schema( # Number of power failures
-            accuracy_decimals=0,
-            # icon="mdi:alert-circle-outline",
-        ),
-        cv.Optional("electricity_long_failures"): sensor.sensor_schema( # Number of long power failures
-            accuracy_decimals=0,
-            # icon="mdi:alert-outline",
-        ),
-        cv.Optional("electricity_sags_l1"): sensor.sensor_schema(accuracy_decimals=0),
-        cv.Optional("electricity_sags_l2"): sensor.sensor_schema(accuracy_decimals=0),
-        cv.Optional("electricity_sags_l3"): sensor.sensor_schema(accuracy_decimals=0),
-        cv.Optional("electricity_swells_l1"): sensor.sensor_schema(accuracy_decimals=0),
-        cv.Optional("electricity_swells_l2"): sensor.sensor_schema(accuracy_decimals=0),
-        cv.Optional("electricity_swells_l3"): sensor.sensor_schema(accuracy_decimals=0),
+    # --- Electricity Status & Failures ---
+    # Unit depends on specific OBIS code definition
+    ("electricity_threshold", _num_schema(decimals=3)), # Not common in modern DSMR
+    ("electricity_switch_position", _COUNT_SCHEMA), # Not common
+    ("electricity_failures", _COUNT_SCHEMA), # Number of power failures
+    ("electricity_long_failures", _COUNT_SCHEMA), # Number of long power failures
+    ("electricity_sags_l1", _COUNT_SCHEMA),
+    ("electricity_sags_l2", _COUNT_SCHEMA),
+    ("electricity_sags_l3", _COUNT_SCHEMA),
+    ("electricity_swells_l1", _COUNT_SCHEMA),
+    ("electricity_swells_l2", _COUNT_SCHEMA),
+    ("electricity_swells_l3", _COUNT_SCHEMA),
 
-        # --- Phase-Specific Current ---
-        cv.Optional("current_l1"): sensor.sensor_schema(
-            unit_of_measurement=UNIT_AMPERE,
-            accuracy_decimals=1, # Or 2, or 3 depending on meter/parser
-            device_class=DEVICE_CLASS_CURRENT,
-            state_class=STATE_CLASS_MEASUREMENT,
-            # icon="mdi:current-ac",
-        ),
-        cv.Optional("current_l2"): sensor.sensor_schema(
-            unit_of_measurement=UNIT_AMPERE,
-            accuracy_decimals=1,
-            device_class=DEVICE_CLASS_CURRENT,
-            state_class=STATE_CLASS_MEASUREMENT,
-        ),
-        cv.Optional("current_l3"): sensor.sensor_schema(
-            unit_of_measurement=UNIT_AMPERE,
-            accuracy_decimals=1,
-            device_class=DEVICE_CLASS_CURRENT,
-            state_class=STATE_CLASS_MEASUREMENT,
-        ),
+    # --- Phase-Specific Current ---
+    ("current_l1", _CURRENT_SCHEMA),
+    ("current_l2", _CURRENT_SCHEMA),
+    ("current_l3", _CURRENT_SCHEMA),
 
-        # --- Phase-Specific Active Power ---
-        cv.Optional("power_delivered_l1"): sensor.sensor_schema(
-            unit_of_measurement=UNIT_KILOWATT,
-            accuracy_decimals=3,
-            device_class=DEVICE_CLASS_POWER,
-            state_class=STATE_CLASS_MEASUREMENT,
-        ),
-        cv.Optional("power_delivered_l2"): sensor.sensor_schema(
-            unit_of_measurement=UNIT_KILOWATT,
-            accuracy_decimals=3,
-            device_class=DEVICE_CLASS_POWER,
-            state_class=STATE_CLASS_MEASUREMENT,
-        ),
-        cv.Optional("power_delivered_l3"): sensor.sensor_schema(
-            unit_of_measurement=UNIT_KILOWATT,
-            accuracy_decimals=3,
-            device_class=DEVICE_CLASS_POWER,
-            state_class=STATE_CLASS_MEASUREMENT,
-        ),
-        cv.Optional("power_returned_l1"): sensor.sensor_schema(
-            unit_of_measurement=UNIT_KILOWATT,
-            accuracy_decimals=3,
-            device_class=DEVICE_CLASS_POWER,
-            state_class=STATE_CLASS_MEASUREMENT,
-        ),
-        cv.Optional("power_returned_l2"): sensor.sensor_schema(
-            unit_of_measurement=UNIT_KILOWATT,
-            accuracy_decimals=3,
-            device_class=DEVICE_CLASS_POWER,
-            state_class=STATE_CLASS_MEASUREMENT,
-        ),
-        cv.Optional("power_returned_l3"): sensor.sensor_schema(
-            unit_of_measurement=UNIT_KILOWATT,
-            accuracy_decimals=3,
-            device_class=DEVICE_CLASS_POWER,
-            state_class=STATE_CLASS_MEASUREMENT,
-        ),
+    # --- Phase-Specific Active Power ---
+    ("power_delivered_l1", _POWER_MEAS_SCHEMA),
+    ("power_delivered_l2", _POWER_MEAS_SCHEMA),
+    ("power_delivered_l3", _POWER_MEAS_SCHEMA),
+    ("power_returned_l1", _POWER_MEAS_SCHEMA),
+    ("power_returned_l2", _POWER_MEAS_SCHEMA),
+    ("power_returned_l3", _POWER_MEAS_SCHEMA),
 
-        # --- Phase-Specific Reactive Power (Example) ---
-        cv.Optional("reactive_power_delivered_l1"): sensor.sensor_schema(
-            unit_of_measurement=UNIT_KILOVOLT_AMPS_REACTIVE, # kvar
-            accuracy_decimals=3,
-            state_class=STATE_CLASS_MEASUREMENT,
-        ),
-        cv.Optional("reactive_power_delivered_l2"): sensor.sensor_schema(
-            unit_of_measurement=UNIT_KILOVOLT_AMPS_REACTIVE,
-            accuracy_decimals=3,
-            state_class=STATE_CLASS_MEASUREMENT,
-        ),
-        cv.Optional("reactive_power_delivered_l3"): sensor.sensor_schema(
-            unit_of_measurement=UNIT_KILOVOLT_AMPS_REACTIVE,
-            accuracy_decimals=3,
-            state_class=STATE_CLASS_MEASUREMENT,
-        ),
-        cv.Optional("reactive_power_returned_l1"): sensor.sensor_schema(
-            unit_of_measurement=UNIT_KILOVOLT_AMPS_REACTIVE,
-            accuracy_decimals=3,
-            state_class=STATE_CLASS_MEASUREMENT,
-        ),
-        cv.Optional("reactive_power_returned_l2"): sensor.sensor_schema(
-            unit_of_measurement=UNIT_KILOVOLT_AMPS_REACTIVE,
-            accuracy_decimals=3,
-            state_class=STATE_CLASS_MEASUREMENT,
-        ),
-        cv.Optional("reactive_power_returned_l3"): sensor.sensor_schema(
-            unit_of_measurement=UNIT_KILOVOLT_AMPS_REACTIVE,
-            accuracy_decimals=3,
-            state_class=STATE_CLASS_MEASUREMENT,
-        ),
+    # --- Phase-Specific Reactive Power (Example) ---
+    ("reactive_power_delivered_l1", _KVAR_SCHEMA),
+    ("reactive_power_delivered_l2", _KVAR_SCHEMA),
+    ("reactive_power_delivered_l3", _KVAR_SCHEMA),
+    ("reactive_power_returned_l1", _KVAR_SCHEMA),
+    ("reactive_power_returned_l2", _KVAR_SCHEMA),
+    ("reactive_power_returned_l3", _KVAR_SCHEMA),
 
-        # --- Phase-Specific Voltage ---
-        cv.Optional("voltage_l1"): sensor.sensor_schema(
-            unit_of_measurement=UNIT_VOLT,
-            accuracy_decimals=1,
-            device_class=DEVICE_CLASS_VOLTAGE,
-            state_class=STATE_CLASS_MEASUREMENT,
-            # icon="mdi:lightning-bolt",
-        ),
-        cv.Optional("voltage_l2"): sensor.sensor_schema(
-            unit_of_measurement=UNIT_VOLT,
-            accuracy_decimals=1,
-            device_class=DEVICE_CLASS_VOLTAGE,
-            state_class=STATE_CLASS_MEASUREMENT,
-        ),
-        cv.Optional("voltage_l3"): sensor.sensor_schema(
-            unit_of_measurement=UNIT_VOLT,
-            accuracy_decimals=1,
-            device_class=DEVICE_CLASS_VOLTAGE,
-            state_class=STATE_CLASS_MEASUREMENT,
-        ),
+    # --- Phase-Specific Voltage ---
+    ("voltage_l1", _VOLTAGE_SCHEMA),
+    ("voltage_l2", _VOLTAGE_SCHEMA),
+    ("voltage_l3", _VOLTAGE_SCHEMA),
 
-        # --- Other Meter Types (Gas, Water, etc.) ---
-        cv.Optional("gas_delivered"): sensor.sensor_schema( # For Dutch meters
-            unit_of_measurement=UNIT_CUBIC_METER,
-            accuracy_decimals=3,
-            device_class=DEVICE_CLASS_GAS,
-            state_class=STATE_CLASS_TOTAL_INCREASING,
-            # icon="mdi:fire",
-        ),
-        cv.Optional("gas_delivered_be"): sensor.sensor_schema( # For Belgian meters
-            unit_of_measurement=UNIT_CUBIC_METER,
-            accuracy_decimals=3,
-            device_class=DEVICE_CLASS_GAS,
-            state_class=STATE_CLASS_TOTAL_INCREASING,
-            # icon="mdi:fire",
-        ),
-        cv.Optional("water_delivered"): sensor.sensor_schema(
-            unit_of_measurement=UNIT_CUBIC_METER,
-            accuracy_decimals=3,
-            device_class=DEVICE_CLASS_WATER,
-            state_class=STATE_CLASS_TOTAL_INCREASING,
-            # icon="mdi:water",
-        ),
-        # --- SESKO / Finnish specific or other advanced sensors (examples) ---
-        # These are often defined via custom_obis_sensors, but could be standard if widely used
-        # and supported by the vendored parser's fields.h.
-        # Example: Maximum Demand
-        cv.Optional("active_energy_import_current_average_demand"): sensor.sensor_schema( # e.g. OBIS 1-0:1.4.0
-            unit_of_measurement=UNIT_KILOWATT,
-            accuracy_decimals=3,
-            device_class=DEVICE_CLASS_POWER,
-            state_class=STATE_CLASS_MEASUREMENT,
-            # icon="mdi:chart-bell-curve",
-        ),
-        cv.Optional("active_energy_import_maximum_demand_running_month"): sensor.sensor_schema( # e.g. OBIS 1-0:1.6.0
-            unit_of_measurement=UNIT_KILOWATT,
-            accuracy_decimals=3,
-            device_class=DEVICE_CLASS_POWER,
-            state_class=STATE_CLASS_MEASUREMENT, # Or total_increasing if it's a peak that only goes up in a period
-            # icon="mdi:chart-gantt",
-        ),
-        cv.Optional("active_energy_import_maximum_demand_last_13_months"): sensor.sensor_schema( # e.g. OBIS 1-0:1.6.0.x
-            unit_of_measurement=UNIT_KILOWATT,
-            accuracy_decimals=3,
-            device_class=DEVICE_CLASS_POWER,
-            state_class=STATE_CLASS_MEASUREMENT,
-            # icon="mdi:chart-timeline-variant",
-        ),
-        # Add other standard sensors as needed, mirroring official DSMR component capabilities
-        # or common fields from the matthijskooijman/arduino-dsmr parser library.
+    # --- Other Meter Types (Gas, Water, etc.) ---
+    ("gas_delivered", _GAS_SCHEMA), # For Dutch meters
+    ("gas_delivered_be", _GAS_SCHEMA), # For Belgian meters
+    ("water_delivered", _num_schema(
+        unit=UNIT_CUBIC_METER,
+        decimals=3,
+        device_class=DEVICE_CLASS_WATER,
+        state_class=STATE_CLASS_TOTAL_INCREASING,
+    )),
+    # --- SESKO / Finnish specific or other advanced sensors (examples) ---
+    # These are often defined via custom_obis_sensors, but could be standard if widely used
+    # and supported by the vendored parser's fields.h.
+    # Example: Maximum Demand
+    ("active_energy_import_current_average_demand", _POWER_MEAS_SCHEMA), # e.g. OBIS 1-0:1.4.0
+    # Or total_increasing if it's a peak that only goes up in a period
+    ("active_energy_import_maximum_demand_running_month", _POWER_MEAS_SCHEMA), # e.g. OBIS 1-0:1.6.0
+    ("active_energy_import_maximum_demand_last_13_months", _POWER_MEAS_SCHEMA), # e.g. OBIS 1-0:1.6.0.x
+    # Add other standard sensors as needed, mirroring official DSMR component capabilities
+    # or common fields from the matthijskooijman/arduino-dsmr parser library.
+)
+
+# Defines the YAML configuration schema for the dsmr_custom sensor platform.
+# Users can enable and configure individual standard numeric DSMR sensors here.
+CONFIG_SCHEMA = cv.Schema(
+    {
+        # Required: Link to an existing dsmr_custom hub component ID.
+        # All sensors defined here will be associated with this hub.
+        _GENERATE_HUB_ID: _HUB_VALIDATOR,
+        # Optional configuration for each standard numeric sensor.
+        **{cv.Optional(key): schema for key, schema in _NUMERIC_SENSOR_DEFS},
     }
 ).extend(cv.COMPONENT_SCHEMA)
 
+# C++ hub setter name and DSMR_CUSTOM_SENSOR_LIST entry for each standard
+# sensor key, formatted once at import.
+_SENSOR_CODEGEN = tuple(
+    (key, f"set_{key}", f"F({key})") for key, _ in _NUMERIC_SENSOR_DEFS
+)
+
 
 async def to_code(config):
     """
@@ -380,9 +264,11 @@ async def to_code(config):
     # The keys in CONFIG_SCHEMA (e.g., "energy_delivered_tariff1") are used here.
     active_standard_sensors_for_macro = []
 
-    for key, conf_item in config.items():
-        # Skip items that are not sensor configurations (e.g., the hub ID itself).
-        if not isinstance(conf_item, dict) or key == CONF_DSMR_CUSTOM_HUB_ID:
+    for key, setter_name, macro_token in _SENSOR_CODEGEN:
+        # Only standard sensor keys are visited, so the hub ID and component
+        # options never need to be filtered out here.
+        conf_item = config.get(key)
+        if conf_item is None:
             continue
 
         # If a sensor configuration for 'key' is present in the YAML:
@@ -396,11 +282,11 @@ async def to_code(config):
         #    is expected to match the 'key'.
         #    This also populates the standard_numeric_sensor_pointers_ map in C++
         #    which is used by the override mechanism.
-        cg.add(getattr(hub, f"set_{key}")(s))
+        cg.add(getattr(hub, setter_name)(s))
 
-        # 3. Add the key (which is the symbolic name of the sensor) to the list
-        #    for C++ macro generation. The C++ macro will use these symbolic names.
-        active_standard_sensors_for_macro.append(f"F({key})")
+        # 3. Add the precomputed F(key) token (key is the symbolic name of the sensor)
+        #    to the list for C++ macro generation. The C++ macro will use these symbolic names.
+        active_standard_sensors_for_macro.append(macro_token)
 
     # Generate the DSMR_CUSTOM_SENSOR_LIST C++ preprocessor macro.
     # This macro is consumed by the C++ MyData struct (based on the vendored parser)
@@ -412,12 +298,11 @@ async def to_code(config):
     # with the list of standard sensors defined here, similar to how the official
     # ESPHome DSMR component handles its sensor lists via DSMR_SENSOR_LIST.
     # This dsmr_custom component adapts that pattern for its standard sensors.
+    # Nothing is emitted when no standard numeric sensors are configured: dsmr.h
+    # falls back to an empty list for an undefined macro, and leaving it undefined
+    # keeps its DSMR_CUSTOM_BOTH separator logic correct.
     if active_standard_sensors_for_macro:
         cg.add_define(
             "DSMR_CUSTOM_SENSOR_LIST(F, sep)", # Macro signature expected by C++
             cg.RawExpression(" sep ".join(active_standard_sensors_for_macro))
         )
-    else:
-        # Define as empty if no standard numeric sensors are configured via this platform.
-        # This prevents compilation errors in C++ if the macro is used unconditionally.
-        cg.add_define("DSMR_CUSTOM_SENSOR_LIST(F, sep)", "")
@@ -41,7 +41,6 @@ import esphome.config_validation as cv
 # Import the global text_sensor component module for text_sensor.text_sensor_schema.
 from esphome.components import text_sensor
 from esphome.const import (
-    CONF_ID,         # Used internally by text_sensor.new_text_sensor
     CONF_INTERNAL,   # Option to mark a sensor as internal (not exposed to Home Assistant)
     # Other constants like CONF_ICON could be used in schema if needed.
 )
@@ -50,89 +49,87 @@ from esphome.const import (
 from . import Dsmr as DsmrCustomHubClass # Alias for clarity
 # Configuration key to link platform sensors to a specific dsmr_custom hub instance.
 CONF_DSMR_CUSTOM_HUB_ID = "dsmr_custom_hub_id"
+# Schema key and validator for CONF_DSMR_CUSTOM_HUB_ID, created once and shared by the schema.
+_GENERATE_HUB_ID = cv.GenerateID(CONF_DSMR_CUSTOM_HUB_ID)
+_HUB_VALIDATOR = cv.use_id(DsmrCustomHubClass)
 
 # Ensures the main 'dsmr_custom' hub component (defined in __init__.py)
 # is loaded automatically when this text_sensor platform is used.
 AUTO_LOAD = ["dsmr_custom"]
 
+# All standard text sensors share the same plain schema; it is built once and
+# reused for every key below (text_sensor_schema() generates a fresh ID per
+# configured sensor, so sharing the schema object is safe).
+_TEXT_SENSOR_SCHEMA = text_sensor.text_sensor_schema()
+
+# Full P1 Telegram (for debugging or advanced use cases)
+# This is often very long and primarily useful for diagnostics.
+# Defaulting to internal: true is a good practice.
+_TELEGRAM_SCHEMA = text_sensor.text_sensor_schema().extend(
+    {cv.Optional(CONF_INTERNAL, default=True): cv.boolean}
+    # icon="mdi:text-long",
+)
+
+# Standard text sensors as (key, schema) rows. Each key (e.g., "identification")
+# names the hub setter (set_<key>) used in to_code() and, except for "telegram",
+# becomes part of the C++ preprocessor macro DSMR_CUSTOM_TEXT_SENSOR_LIST.
+_TEXT_SENSOR_DEFS = (
+    # P1 Telegram Header / Meter Identification
+    # DEVELOPER_NOTE_FOR_ESPHOME_DSMR_TEAM: Raw P1 Identification Line -
+    # This 'identification' text sensor, when enabled, typically captures the raw
+    # first line of the P1 telegram (meter identification string) as provided by the
+    # vendored parser. Exposing this is invaluable for users debugging P1 port issues,
+    # verifying meter compatibility (e.g., with Finnish /ADN9... headers), and for
+    # community sharing of configurations. The official DSMR component could benefit
+    # from a similar standard text sensor for this purpose.
+    ("identification", _TEXT_SENSOR_SCHEMA),
+    # DSMR P1 Version Information
+    ("p1_version", _TEXT_SENSOR_SCHEMA), # e.g., OBIS 1-3:0.2.8 for DSMR 2.2+
+    ("p1_version_be", _TEXT_SENSOR_SCHEMA), # e.g., OBIS 0-0:96.1.4 for Belgian DSMR
+    # Timestamp of the P1 Message
+    ("timestamp", _TEXT_SENSOR_SCHEMA), # OBIS 0-0:1.0.0
+    # Electricity Tariff Information
+    ("electricity_tariff", _TEXT_SENSOR_SCHEMA), # OBIS 0-0:96.14.0
+    # Electricity Failure Log (can be a multi-line string)
+    ("electricity_failure_log", _TEXT_SENSOR_SCHEMA), # OBIS 1-0:99.97.0
+    # Messages from the Utility
+    ("message_short", _TEXT_SENSOR_SCHEMA), # OBIS 0-0:96.13.1 (numeric code)
+    ("message_long", _TEXT_SENSOR_SCHEMA), # OBIS 0-0:96.13.0 (text message)
+    # Equipment Identifiers for M-Bus devices (Gas, Water, Thermal, etc.)
+    ("gas_equipment_id", _TEXT_SENSOR_SCHEMA), # e.g., OBIS 0-1:96.1.0
+    ("thermal_equipment_id", _TEXT_SENSOR_SCHEMA), # e.g., OBIS 0-2:96.1.0
+    ("water_equipment_id", _TEXT_SENSOR_SCHEMA), # e.g., OBIS 0-3:96.1.0
+    ("sub_equipment_id", _TEXT_SENSOR_SCHEMA), # Generic slave device, e.g., OBIS 0-4:96.1.0
+    # Some parsers might provide gas delivery as a text field including timestamp and unit.
+    # While gas_delivered is usually numeric, a text version might exist in some parser fields.
+    ("gas_delivered_text", _TEXT_SENSOR_SCHEMA),
+    # Full P1 Telegram, internal by default (see _TELEGRAM_SCHEMA)
+    ("telegram", _TELEGRAM_SCHEMA),
+    # Add other standard text sensors as needed, mirroring official DSMR component
+    # capabilities or common fields from the matthijskooijman/arduino-dsmr parser library.
+)
+
 # Defines the YAML configuration schema for the dsmr_custom text_sensor platform.
 # Users can enable and configure individual standard text DSMR sensors here.
 CONFIG_SCHEMA = cv.Schema(
     {
         # Required: Link to an existing dsmr_custom hub component ID.
-        cv.GenerateID(CONF_DSMR_CUSTOM_HUB_ID): cv.use_id(DsmrCustomHubClass),
-
+        _GENERATE_HUB_ID: _HUB_VALIDATOR,
         # Optional configuration for each standard text sensor.
-        # These keys (e.g., "identification") become part of the C++
-        # preprocessor macro DSMR_CUSTOM_TEXT_SENSOR_LIST.
-
-        # P1 Telegram Header / Meter Identification
-        # DEVELOPER_NOTE_FOR_ESPHOME_DSMR_TEAM: Raw P1 Identification Line -
-        # This 'identification' text sensor, when enabled, typically captures the raw
-        # first line of the P1 telegram (meter identification string) as provided by the
-        # vendored parser. Exposing this is invaluable for users debugging P1 port issues,
-        # verifying meter compatibility (e.g., with Finnish /ADN9... headers), and for
-        # community sharing of configurations. The official DSMR component could benefit
-        # from a similar standard text sensor for this purpose.
-        cv.Optional("identification"): text_sensor.text_sensor_schema(
-            # icon="mdi:barcode-scan", # Example icon
-        ),
-        # DSMR P1 Version Information
-        cv.Optional("p1_version"): text_sensor.text_sensor_schema( # e.g., OBIS 1-3:0.2.8 for DSMR 2.2+
-            # icon="mdi:tag-text-outline",
-        ),
-        cv.Optional("p1_version_be"): text_sensor.text_sensor_schema( # e.g., OBIS 0-0:96.1.4 for Belgian DSMR
-            # icon="mdi:tag-text-outline",
-        ),
-        # Timestamp of the P1 Message
-        cv.Optional("timestamp"): text_sensor.text_sensor_schema( # OBIS 0-0:1.0.0
-            # icon="mdi:clock-outline",
-        ),
-        # Electricity Tariff Information
-        cv.Optional("electricity_tariff"): text_sensor.text_sensor_schema( # OBIS 0-0:96.14.0
-            # icon="mdi:theme-light-dark",
-        ),
-        # Electricity Failure Log (can be a multi-line string)
-        cv.Optional("electricity_failure_log"): text_sensor.text_sensor_schema( # OBIS 1-0:99.97.0
-            # icon="mdi:format-list-bulleted",
-        ),
-        # Messages from the Utility
-        cv.Optional("message_short"): text_sensor.text_sensor_schema( # OBIS 0-0:96.13.1 (numeric code)
-            # icon="mdi:message-text-outline",
-        ),
-        cv.Optional("message_long"): text_sensor.text_sensor_schema( # OBIS 0-0:96.13.0 (text message)
-            # icon="mdi:message-text",
-        ),
-        # Equipment Identifiers for M-Bus devices (Gas, Water, Thermal, etc.)
-        cv.Optional("gas_equipment_id"): text_sensor.text_sensor_schema( # e.g., OBIS 0-1:96.1.0
-            # icon="mdi:identifier",
-        ),
-        cv.Optional("thermal_equipment_id"): text_sensor.text_sensor_schema( # e.g., OBIS 0-2:96.1.0
-            # icon="mdi:identifier",
-        ),
-        cv.Optional("water_equipment_id"): text_sensor.text_sensor_schema( # e.g., OBIS 0-3:96.1.0
-            # icon="mdi:identifier",
-        ),
-        cv.Optional("sub_equipment_id"): text_sensor.text_sensor_schema( # Generic slave device, e.g., OBIS 0-4:96.1.0
-            # icon="mdi:identifier",
-        ),
-        # Some parsers might provide gas delivery as a text field including timestamp and unit.
-        # While gas_delivered is usually numeric, a text version might exist in some parser fields.
-        cv.Optional("gas_delivered_text"): text_sensor.text_sensor_schema(
-            # icon="mdi:fire",
-        ),
-        # Full P1 Telegram (for debugging or advanced use cases)
-        # This is often very long and primarily useful for diagnostics.
-        # Defaulting to internal: true is a good practice.
-        cv.Optional("telegram"): text_sensor.text_sensor_schema().extend(
-            {cv.Optional(CONF_INTERNAL, default=True): cv.boolean}
-            # icon="mdi:text-long",
-        ),
-        # Add other standard text sensors as needed, mirroring official DSMR component
-        # capabilities or common fields from the matthijskooijman/arduino-dsmr parser library.
+        **{cv.Optional(key): schema for key, schema in _TEXT_SENSOR_DEFS},
     }
 ).extend(cv.COMPONENT_SCHEMA)
 
+# C++ hub setter name and DSMR_CUSTOM_TEXT_SENSOR_LIST entry for each standard
+# text sensor key, formatted once at import.
+# The special 'telegram' sensor gets no macro entry (None): the vendored parser
+# (matthijskooijman/arduino-dsmr) does not have a 'telegram' field in its
+# ParsedData struct; the full telegram is handled separately via set_telegram().
+_TEXT_SENSOR_CODEGEN = tuple(
+    (key, f"set_{key}", None if key == "telegram" else f"F({key})")
+    for key, _ in _TEXT_SENSOR_DEFS
+)
+
 
 async def to_code(config):
     """
@@ -145,9 +142,11 @@ async def to_code(config):
     # List to store the C++ names of enabled standard text sensors for macro generation.
     active_standard_text_sensors_for_macro = []
 
-    for key, conf_item in config.items():
-        # Skip items that are not text_sensor configurations (e.g., the hub ID itself).
-        if not isinstance(conf_item, dict) or key == CONF_DSMR_CUSTOM_HUB_ID:
+    for key, setter_name, macro_token in _TEXT_SENSOR_CODEGEN:
+        # Only standard text sensor keys are visited, so the hub ID and
+        # component options never need to be filtered out here.
+        conf_item = config.get(key)
+        if conf_item is None:
             continue
 
         # If a text_sensor configuration for 'key' is present in the YAML:
@@ -160,15 +159,12 @@ async def to_code(config):
         #    is expected to match the 'key'.
         #    This also populates the standard_text_sensor_pointers_ map in C++
         #    which is used by the override mechanism.
-        cg.add(getattr(hub, f"set_{key}")(var))
+        cg.add(getattr(hub, setter_name)(var))
 
-        # 3. Add the key (symbolic name) to the list for C++ macro generation,
-        #    unless it's the special 'telegram' sensor, which might be handled
-        #    differently or not included in the standard field parsing list of the vendored parser.
-        #    The vendored parser (matthijskooijman/arduino-dsmr) does not typically have a
-        #    'telegram' field in its ParsedData struct; the full telegram is handled separately.
-        if key != "telegram": # Exclude 'telegram' from the macro list for parser fields
-            active_standard_text_sensors_for_macro.append(f"F({key})")
+        # 3. Add the precomputed F(key) token to the list for C++ macro generation.
+        #    Keys without a token (the special 'telegram' sensor) are not parser fields.
+        if macro_token is not None:
+            active_standard_text_sensors_for_macro.append(macro_token)
 
     # Generate the DSMR_CUSTOM_TEXT_SENSOR_LIST C++ preprocessor macro.
     # This macro is consumed by the C++ MyData struct (based on the vendored parser)
@@ -177,11 +173,10 @@ async def to_code(config):
     # DEVELOPER_NOTE_FOR_ESPHOME_DSMR_TEAM: This macro generation, similar to
     # DSMR_CUSTOM_SENSOR_LIST in sensor.py, allows the C++ parser to be templatized
     # with standard text fields. This aligns with ESPHome's architectural patterns.
+    # Nothing is emitted when no standard text sensors (excluding 'telegram') are
+    # configured: dsmr.h falls back to a default list for an undefined macro.
     if active_standard_text_sensors_for_macro:
         cg.add_define(
             "DSMR_CUSTOM_TEXT_SENSOR_LIST(F, sep)", # Macro signature expected by C++
             cg.RawExpression(" sep ".join(active_standard_text_sensors_for_macro))
         )
-    else:
-        # Define as empty if no standard text sensors (excluding 'telegram') are configured.
-        cg.add_define("DSMR_CUSTOM_TEXT_SENSOR_LIST(F, sep)", "")